@@ -10,6 +10,7 @@ import numpy.ma as ma
 
 from cis.collocation.haversinedistancekdtreeindex import HaversineDistanceKDTreeIndex
 from cis.time_util import convert_datetime_to_std_time
+from cis.utils import find_bucket_indices
 
 
 class GridCellBinIndexInSlices(object):
@@ -79,7 +80,7 @@ class GridCellBinIndexInSlices(object):
         indices = np.vstack(
             [np.where(
                  ci < max_coordinate_value,
-                 np.searchsorted(bi, ci, side='right') - 1,
+                 find_bucket_indices(bi, ci),
                  -1)
              for bi, ci, max_coordinate_value in bounds_coords_max])
 
@@ -207,13 +207,8 @@ class CommonData(object):
     def _get_coord(self, name):
         from cis.utils import standard_axes
         def _try_coord(data, coord_dict):
-            import cis.exceptions as cis_ex
-            import iris.exceptions as iris_ex
-            try:
-                coord = data.coord(**coord_dict)
-            except (iris_ex.CoordinateNotFoundError, cis_ex.CoordinateNotFoundError):
-                coord = None
-            return coord
+            coords = data.coords(**coord_dict)
+            return coords[0] if len(coords) == 1 else None
 
         coord = _try_coord(self, dict(name_or_coord=name)) or _try_coord(self, dict(standard_name=name)) \
             or _try_coord(self, dict(standard_name=standard_axes.get(name.upper(), None))) or \
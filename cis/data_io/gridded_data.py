@@ -1,4 +1,4 @@
-from time import gmtime, strftime
+from time import gmtime, strftime, time
 import logging
 
 import iris.cube
@@ -8,8 +8,18 @@ import numpy as np
 from cis.data_io.common_data import CommonData, CommonDataList
 from cis.data_io.hyperpoint import HyperPoint
 from cis.data_io.hyperpoint_view import GriddedHyperPointView
+from cis.utils import find_bucket_indices
 import six
 
+# The standard coordinate names, in the order they appear in a HyperPoint
+_STD_NAMES = tuple(HyperPoint.standard_names)
+
+# The most recent history timestamp and the second it was created for, so it is only formatted once per second
+_TIMESTAMP_CACHE = [None, '']
+
+# Lazy datasets larger than this (in bytes) are converted to a DataFrame in chunks
+_LAZY_DATA_FRAME_THRESHOLD = 2 ** 28
+
 
 def load_cube(*args, **kwargs):
     """
@@ -37,12 +47,54 @@ def load_cube(*args, **kwargs):
 
 
 def make_from_cube(cube):
-    gd = None
     if isinstance(cube, iris.cube.Cube):
-        return GriddedData.make_from_cube(cube)
+        return cube if isinstance(cube, GriddedData) else _convert_cube(cube)
     elif isinstance(cube, iris.cube.CubeList):
         return GriddedDataList(cube)
-    return gd
+    return None
+
+
+def _convert_cube(cube):
+    """
+    Convert an iris cube (which isn't already GriddedData) into GriddedData in place
+    """
+    cube.__class__ = GriddedData
+    cube._local_attributes = set()
+    cube._std_coords_cache = None
+    return cube
+
+
+def _rotate(array, split, axis):
+    """
+    Rotate an array along the given axis so that the element at index split becomes the first one (equivalent to
+    np.roll(array, -split, axis)). The output is allocated once and filled with two slice assignments.
+
+    :param array: The (possibly masked) array to rotate
+    :param int split: The index along axis which should be moved to the start
+    :param int axis: The axis to rotate along
+    :return: A new rotated array
+    """
+    n = array.shape[axis]
+    head = (slice(None),) * axis
+    rotated = np.empty_like(array)
+    rotated[head + (slice(None, n - split),)] = array[head + (slice(split, None),)]
+    rotated[head + (slice(n - split, None),)] = array[head + (slice(None, split),)]
+    return rotated
+
+
+def _rotate_lazy(array, split, axis):
+    """
+    Rotate a dask array along the given axis in the same way as _rotate. This only adds the slicing and
+    concatenation to the task graph, so no data is loaded.
+
+    :param dask.array.Array array: The lazy array to rotate
+    :param int split: The index along axis which should be moved to the start
+    :param int axis: The axis to rotate along
+    :return dask.array.Array: A new lazy rotated array
+    """
+    import dask.array as da
+    head = (slice(None),) * axis
+    return da.concatenate([array[head + (slice(split, None),)], array[head + (slice(None, split),)]], axis=axis)
 
 
 class GriddedData(iris.cube.Cube, CommonData):
@@ -60,7 +112,8 @@ class GriddedData(iris.cube.Cube, CommonData):
         except KeyError:
             pass
 
-        self._local_attributes = []
+        self._local_attributes = set()
+        self._std_coords_cache = None
 
         try:
             super(GriddedData, self).__init__(*args, **kwargs)
@@ -76,26 +129,30 @@ class GriddedData(iris.cube.Cube, CommonData):
         :param cube:
         :return:
         """
-        if not isinstance(cube, GriddedData):
-            cube.__class__ = GriddedData
-            cube._local_attributes = []
-        return cube
+        return cube if isinstance(cube, GriddedData) else _convert_cube(cube)
 
     def make_new_with_same_coordinates(self, data=None, var_name=None, standard_name=None,
-                                       long_name=None, history=None, units=None, flatten=False):
+                                       long_name=None, history=None, units=None, flatten=False, lazy=True):
         """
         Create a new, empty GriddedData object with the same coordinates as this one
-        :param data: Data to use (if None then defaults to all zeros)
+        :param data: Data to use (if None then defaults to all zeros, with the same dtype as this data)
         :param var_name: Variable name
         :param standard_name: Variable CF standard name
         :param long_name: Variable long name
         :param history: Data history string
         :param units: Variable units
         :param flatten: Whether to flatten the data shape (for ungridded data only)
+        :param lazy: If no data is given, create the zeros as a lazy (dask) array so that no memory is allocated until
+         the data is accessed
         :return: GriddedData instance
         """
         if data is None:
-            data = np.zeros(self.shape)
+            if lazy:
+                import dask.array as da
+                chunks = self.lazy_data().chunks if self.has_lazy_data() else 'auto'
+                data = da.zeros(self.shape, chunks=chunks, dtype=self.dtype)
+            else:
+                data = np.zeros(self.shape, dtype=self.dtype)
         data = GriddedData(data=data, standard_name=standard_name, long_name=long_name, var_name=var_name,
                            units=units, dim_coords_and_dims=self._dim_coords_and_dims,
                            aux_coords_and_dims=self._aux_coords_and_dims, aux_factories=self._aux_factories)
@@ -123,40 +180,54 @@ class GriddedData(iris.cube.Cube, CommonData):
         """Returns a HyperPointView of the points.
         :return: HyperPointView of all the data points
         """
-        all_coords = [((c[0].points, c[1]) if c is not None else None) for c in self.find_standard_coords()]
-        return GriddedHyperPointView(all_coords, self.data)
+        return GriddedHyperPointView(self._hyperpoint_coords(), self.data)
 
     def get_all_points(self):
         """Returns a HyperPointView of the points.
         :return: HyperPointView of all the data points
         """
-        all_coords = [((c[0].points, c[1]) if c is not None else None) for c in self.find_standard_coords()]
-        return GriddedHyperPointView(all_coords, self.data)
+        return GriddedHyperPointView(self._hyperpoint_coords(), self.data)
 
     def get_non_masked_points(self):
         """Returns a HyperPointView of the points.
         :return: HyperPointView of all the data points
         """
-        all_coords = [((c[0].points, c[1]) if c is not None else None) for c in self.find_standard_coords()]
-        return GriddedHyperPointView(all_coords, self.data, non_masked_iteration=True)
+        return GriddedHyperPointView(self._hyperpoint_coords(), self.data, non_masked_iteration=True)
+
+    def _hyperpoint_coords(self):
+        """Constructs the list of standard coordinate points and dimensions used to create a GriddedHyperPointView.
+        The points arrays are those held by the coordinates, they are not copied.
+        :return: list of tuples of (points, dimension index) or None if coordinate not present
+        """
+        return [((c[0].points, c[1]) if c is not None else None) for c in self.find_standard_coords()]
 
     def find_standard_coords(self):
         """Constructs a list of the standard coordinates.
         The standard coordinates are latitude, longitude, altitude, air_pressure and time; they occur in the return
         list in this order.
+
+        The result is cached on the object and recalculated whenever the dimension coordinates are added, removed,
+        reordered or have their standard names changed.
         :return: list of coordinates or None if coordinate not present
         """
-        ret_list = []
-
+        # Key on the coordinate objects themselves (compared by identity) rather than their ids, so that the cache
+        #  keeps them alive and a replacement coordinate can't reuse the id of a removed one, and on their standard
+        #  names so that renaming a coordinate in place is picked up
+        key = tuple((coord, coord.standard_name, dim) for coord, dim in self._dim_coords_and_dims)
+        if self._std_coords_cache is not None:
+            cached_key, cached_list = self._std_coords_cache
+            if len(cached_key) == len(key) and \
+                    all(c1 is c2 and n1 == n2 and d1 == d2 for (c1, n1, d1), (c2, n2, d2) in zip(cached_key, key)):
+                return cached_list
+
+        # Map each standard name to its coordinate in a single pass. Iterate in reverse so that if more than one
+        # coordinate has the same standard name it is the first one which is used.
         coords = self.coords(dim_coords=True)
-        for name in HyperPoint.standard_names:
-            coord_and_dim = None
-            for idx, coord in enumerate(coords):
-                if coord.standard_name == name:
-                    coord_and_dim = (coord, idx)
-                    break
-            ret_list.append(coord_and_dim)
+        coords_by_name = {coord.standard_name: (coord, idx) for idx, coord in reversed(list(enumerate(coords)))
+                          if coord.standard_name is not None}
+        ret_list = [coords_by_name.get(name) for name in _STD_NAMES]
 
+        self._std_coords_cache = (key, ret_list)
         return ret_list
 
     @property
@@ -173,7 +244,10 @@ class GriddedData(iris.cube.Cube, CommonData):
         The new entry is prefixed with a timestamp.
         :param new_history: history string
         """
-        timestamp = strftime("%Y-%m-%dT%H:%M:%SZ ", gmtime())
+        now = int(time())
+        if _TIMESTAMP_CACHE[0] != now:
+            _TIMESTAMP_CACHE[:] = [now, strftime("%Y-%m-%dT%H:%M:%SZ ", gmtime(now))]
+        timestamp = _TIMESTAMP_CACHE[1]
         if 'history' not in self.attributes:
             self.attributes['history'] = timestamp + new_history
         else:
@@ -200,58 +274,57 @@ class GriddedData(iris.cube.Cube, CommonData):
         if len(lon_coord) == 0:
             return
         lon_coord = lon_coord[0]
+        lon_points = lon_coord.points
+        # Nothing to do if the (monotonic) longitudes are already within the range
+        if len(lon_points) == 0 or (lon_points[0] >= range_start and lon_points[-1] < range_start + 360.):
+            return
         lon_idx = self.dim_coords.index(lon_coord)
         # Check if there are bounds which we will need to wrap as well
         roll_bounds = (lon_coord.bounds is not None) and (lon_coord.bounds.size != 0)
-        idx1 = np.searchsorted(lon_coord.points, range_start)
-        idx2 = np.searchsorted(lon_coord.points, range_start + 360.)
-        shift = 0
-        new_lon_points = None
-        new_lon_bounds = None
-        if 0 < idx1 < len(lon_coord.points):
-            shift = -idx1
-            lon_min = lon_coord.points[idx1]
-            new_lon_points = np.roll(lon_coord.points, shift, 0)
-            # Calculate which indices need 360 adding to them...
-            indices_to_shift_value_of = new_lon_points < lon_min
-            # ... then, add 360 to all those longitude values
-            new_lon_points[indices_to_shift_value_of] += 360.0
-            if roll_bounds:
-                # If the coordinate has bounds then roll those as well
-                new_lon_bounds = np.roll(lon_coord.bounds, shift, 0)
-                # And shift all of the bounds (upper and lower) for those points which we had to shift. We can't do the
-                # check independently because there may be cases where an upper or lower bound falls outside of the
-                # 360 range, we leave those as they are to preserve monotonicity. See e.g.
-                # test_set_longitude_bounds_wrap_at_360
-                new_lon_bounds[indices_to_shift_value_of] += 360.0
-        elif 0 < idx2 < len(lon_coord.points):
-            shift = len(lon_coord.points) - idx2
-            lon_max = lon_coord.points[idx2]
-            new_lon_points = np.roll(lon_coord.points, shift, 0)
-            indices_to_shift_value_of = new_lon_points >= lon_max
-            new_lon_points[indices_to_shift_value_of] -= 360.0
-            if roll_bounds:
-                new_lon_bounds = np.roll(lon_coord.bounds, shift, 0)
-                # See comment above re preserving monotinicity.
-                new_lon_bounds[indices_to_shift_value_of] -= 360.0
-        if shift != 0:
-            # Ensure we also roll any auxilliary coordinates
-            for aux_coord in self.aux_coords:
-                # Find all of the data dimensions which the auxiliary coordinate spans...
-                dims = self.coord_dims(aux_coord)
-                # .. and check if longitude is one of those dimensions
-                if lon_idx in dims:
-                    # Now roll the axis of the auxiliary coordinate which is associated with the longitude data
-                    # dimension: dims.index(lon_idx)
-                    new_points = np.roll(aux_coord.points, shift, dims.index(lon_idx))
-                    aux_coord.points = new_points
-            # Now roll the data itself
-            new_data = np.roll(self.data, shift, lon_idx)
-            self.data = new_data
-            # Put the new coordinates back in their relevant places
-            self.dim_coords[lon_idx].points = new_lon_points
-            if roll_bounds:
-                self.dim_coords[lon_idx].bounds = new_lon_bounds
+        n_points = len(lon_points)
+        idx1, idx2 = find_bucket_indices(lon_points, [range_start, range_start + 360.], side='left') + 1
+        if 0 < idx1 < n_points:
+            split = idx1
+            # After the rotation the points which were below range_start form a contiguous block at the end, so
+            #  these are the ones which need 360 adding to them
+            shifted = slice(n_points - idx1, None)
+            offset = 360.0
+        elif 0 < idx2 < n_points:
+            split = idx2
+            # Similarly the points which were beyond range_start + 360 now form a contiguous block at the start
+            shifted = slice(None, n_points - idx2)
+            offset = -360.0
+        else:
+            return
+
+        new_lon_points = _rotate(lon_points, split, 0)
+        new_lon_points[shifted] += offset
+        if roll_bounds:
+            # If the coordinate has bounds then roll those as well. And shift all of the bounds (upper and lower) for
+            # those points which we had to shift. We can't do the check independently because there may be cases where
+            # an upper or lower bound falls outside of the 360 range, we leave those as they are to preserve
+            # monotonicity. See e.g. test_set_longitude_bounds_wrap_at_360
+            new_lon_bounds = _rotate(lon_coord.bounds, split, 0)
+            new_lon_bounds[shifted] += offset
+
+        # Ensure we also roll any auxilliary coordinates
+        for aux_coord in self.aux_coords:
+            # Find all of the data dimensions which the auxiliary coordinate spans...
+            dims = self.coord_dims(aux_coord)
+            # .. and check if longitude is one of those dimensions
+            if lon_idx in dims:
+                # Now roll the axis of the auxiliary coordinate which is associated with the longitude data
+                # dimension: dims.index(lon_idx)
+                aux_coord.points = _rotate(aux_coord.points, split, dims.index(lon_idx))
+        # Now roll the data itself, keeping it lazy if it hasn't been loaded yet
+        if self.has_lazy_data():
+            self.data = _rotate_lazy(self.lazy_data(), split, lon_idx)
+        else:
+            self.data = _rotate(self.data, split, lon_idx)
+        # Put the new coordinates back in their relevant places
+        self.dim_coords[lon_idx].points = new_lon_points
+        if roll_bounds:
+            self.dim_coords[lon_idx].bounds = new_lon_bounds
 
     def add_attributes(self, attributes):
         """
@@ -259,7 +332,7 @@ class GriddedData(iris.cube.Cube, CommonData):
         :param attributes: Dictionary of attribute names (keys) and values.
         :return:
         """
-        for key, value in list(attributes.items()):
+        for key, value in attributes.items():
             try:
                 self.attributes[key] = value
             except ValueError:
@@ -268,7 +341,7 @@ class GriddedData(iris.cube.Cube, CommonData):
                 except ValueError as e:
                     logging.warning("Could not set NetCDF attribute '%s' because %s" % (key, e.args[0]))
         # Record that this is a local (variable) attribute, not a global attribute
-        self._local_attributes.extend(list(attributes.keys()))
+        self._local_attributes.update(attributes)
 
     def remove_attribute(self, key):
         """
@@ -277,10 +350,7 @@ class GriddedData(iris.cube.Cube, CommonData):
         :return:
         """
         self.attributes.pop(key, None)
-        try:
-            self._local_attributes.remove(key)
-        except ValueError:
-            pass
+        self._local_attributes.discard(key)
 
     def save_data(self, output_file):
         """
@@ -288,20 +358,31 @@ class GriddedData(iris.cube.Cube, CommonData):
         :param output_file: Output file to save to.
         """
         logging.info('Saving data to %s' % output_file)
-        save_args = {'local_keys': self._local_attributes}
-        # If we have a time coordinate then use that as the unlimited dimension, otherwise don't have any
-        if self.coords('time'):
-            save_args['unlimited_dimensions'] = ['time']
+        # If we have a time coordinate then use that as the unlimited dimension, otherwise don't have any. This is
+        #  always given explicitly so that we don't rely on the Iris default (or global FUTURE settings)
+        save_args = {'local_keys': list(self._local_attributes),
+                     'unlimited_dimensions': ['time'] if self.coords('time') else []}
         iris.save(self, output_file, **save_args)
 
     def as_data_frame(self, copy=True):
         """
         Convert a GriddedData object to a Pandas DataFrame.
 
+        Large lazy datasets are converted one (dask) chunk of the first dimension at a time, so that the whole data
+        array never has to be realised at once.
+
         :param copy: Create a copy of the data for the new DataFrame? Default is True.
         :return: A Pandas DataFrame representing the data and coordinates. Note that this won't include any metadata.
         """
         from iris.pandas import as_data_frame
+        if self.ndim > 0 and self.has_lazy_data() and self.lazy_data().nbytes > _LAZY_DATA_FRAME_THRESHOLD:
+            import pandas as pd
+            frames = []
+            start = 0
+            for size in self.lazy_data().chunks[0]:
+                frames.append(as_data_frame(self[start:start + size]))
+                start += size
+            return pd.concat(frames)
         return as_data_frame(self, copy=copy)
 
     def collapsed(self, coords, how=None, **kwargs):
@@ -414,6 +495,13 @@ class GriddedDataList(iris.cube.CubeList, CommonDataList):
     present in the GriddedData wrapper.
     """
 
+    def __init__(self, *args, **kwargs):
+        super(GriddedDataList, self).__init__(*args, **kwargs)
+        # Ensure all of the items are GriddedData (this converts any plain cubes in place)
+        for item in self:
+            if not isinstance(item, GriddedData):
+                _convert_cube(item)
+
     def __str__(self):
         return "GriddedDataList: \n%s" % super(GriddedDataList, self).__str__()
 
@@ -434,11 +522,8 @@ class GriddedDataList(iris.cube.CubeList, CommonDataList):
         :param output_file: File to save to
         """
         logging.info('Saving data to %s' % output_file)
-        save_args = {}
-
         # If we have a time coordinate then use that as the unlimited dimension, otherwise don't have any
-        if self.coords('time'):
-            save_args['unlimited_dimensions'] = ['time']
+        save_args = {'unlimited_dimensions': ['time'] if self.coords('time') else []}
 
         iris.save(self, output_file, **save_args)
 
@@ -500,10 +585,7 @@ class GriddedDataList(iris.cube.CubeList, CommonDataList):
         :param kwargs:
         :return: GriddedDataList
         """
-        data_list = GriddedDataList()
-        for data in self:
-            data_list.append(data.aggregated_by(*args, **kwargs))
-        return data_list
+        return GriddedDataList([data.aggregated_by(*args, **kwargs) for data in self])
 
     def collapsed(self, *args, **kwargs):
         """
@@ -526,10 +608,7 @@ class GriddedDataList(iris.cube.CubeList, CommonDataList):
         :param kwargs: Keyword arguments for the Iris interpolate method
         :return: Interpolated GriddedDataList
         """
-        output = GriddedDataList()
-        for data in self:
-            output.append(data.interpolate(*args, **kwargs))
-        return output
+        return GriddedDataList([data.interpolate(*args, **kwargs) for data in self])
 
     def regrid(self, *args, **kwargs):
         """
@@ -538,10 +617,7 @@ class GriddedDataList(iris.cube.CubeList, CommonDataList):
         :param kwargs: Keyword arguments for the Iris regrid method
         :return: Regridded GriddedDataList
         """
-        output = GriddedDataList()
-        for data in self:
-            output.append(data.regrid(*args, **kwargs))
-        return output
+        return GriddedDataList([data.regrid(*args, **kwargs) for data in self])
 
     def intersection(self, *args, **kwargs):
         """
@@ -555,7 +631,7 @@ class GriddedDataList(iris.cube.CubeList, CommonDataList):
             new_data = data.intersection(*args, **kwargs)
             if new_data is None:
                 return None
-            output.append(data.intersection(*args, **kwargs))
+            output.append(new_data)
         return output
 
     def extract(self, *args, **kwargs):
@@ -570,7 +646,7 @@ class GriddedDataList(iris.cube.CubeList, CommonDataList):
             new_data = data.extract(*args, **kwargs)
             if new_data is None:
                 return None
-            output.append(data.extract(*args, **kwargs))
+            output.append(new_data)
         return output
 
     def transpose(self, *args, **kwargs):
@@ -212,6 +212,11 @@ class GriddedHyperPointView(HyperPointView):
             if cd is not None:
                 self.coords[cd[1]] = cd[0]
                 self.dims_to_std_coords_map[cd[1]] = sc_idx
+        # Parallel arrays of the dimensions which have a standard coordinate and the index of that coordinate in a
+        # HyperPoint, so that points can be built without looking up each dimension in turn.
+        self._coord_dims = np.array(sorted(self.dims_to_std_coords_map), dtype=np.intp)
+        self._coord_std_idxs = [self.dims_to_std_coords_map[dim] for dim in self._coord_dims]
+        self._num_dims_without_coords = self.num_dimensions - len(self._coord_dims)
         self.length = data.size
         self.non_masked_iteration = non_masked_iteration
         self._verify_no_coord_change_on_setting = False
@@ -238,12 +243,19 @@ class GriddedHyperPointView(HyperPointView):
                     indices = np.unravel_index(item, self.data.shape, order='C')
                 except ValueError:
                     raise IndexError
-        for idx, coord_idx in enumerate(indices):
-            coord = self.coords[idx]
-            if coord is not None:
-                val[self.dims_to_std_coords_map[idx]] = coord[coord_idx]
-            else:
-                val.append(None)
+        coords = self.coords
+        if len(indices) == self.num_dimensions:
+            for dim, sc_idx in zip(self._coord_dims, self._coord_std_idxs):
+                val[sc_idx] = coords[dim][indices[dim]]
+            val.extend([None] * self._num_dims_without_coords)
+        else:
+            # __iter__ leaves length one dimensions out of its indices, so only walk the dimensions given
+            for idx, coord_idx in enumerate(indices):
+                coord = coords[idx]
+                if coord is not None:
+                    val[self.dims_to_std_coords_map[idx]] = coord[coord_idx]
+                else:
+                    val.append(None)
         if self.data is not None:
             val.append(self.data[indices])
         return HyperPoint(*val)
@@ -259,6 +271,10 @@ class GriddedHyperPointView(HyperPointView):
         :return: next HyperPoint
         """
         shape = [c.size for c in self.coords if (c is not None and c.size > 1)]
+        if self.non_masked_iteration and tuple(shape) == self.data.shape:
+            for point in self.iter_non_masked_points():
+                yield point
+            return
         for idx in cis.utils.index_iterator(shape):
             if self.non_masked_iteration and self.data is not None and self.data[idx] is np.ma.masked:
                 continue
@@ -277,11 +293,7 @@ class GriddedHyperPointView(HyperPointView):
         """Iterates over non-masked points regardless of the value of non_masked_iteration
         :return: next HyperPoint
         """
-        # shape = tuple([c.size for c in self.coords if c is not None])
-        shape = self.data.shape
-        for idx in cis.utils.index_iterator(shape):
-            if self.data is not None and self.data[idx] is np.ma.masked:
-                continue
+        for idx in self._non_masked_indices():
             yield self.__getitem__(idx)
 
     def enumerate_non_masked_points(self):
@@ -289,15 +301,15 @@ class GriddedHyperPointView(HyperPointView):
         data array and the corresponding HyperPoint.
         :return: tuple(index of point in flattened view of data, HyperPoint)
         """
-        # shape = tuple([c.size for c in self.coords if c is not None])
-        shape = self.data.shape
-        for idx in range(self.length):
-            if self.data is not None:
-                indices = np.unravel_index(idx, shape, order='C')
-                if self.data[indices] is np.ma.masked:
-                    continue
+        for idx in self._non_masked_indices():
             yield (idx, self.__getitem__(idx))
 
+    def _non_masked_indices(self):
+        """Finds the indices of all the non-masked points in a single vectorised pass over the data mask.
+        :return: array of indices of points in flattened view of data
+        """
+        return np.flatnonzero(~np.ma.getmaskarray(self.data))
+
     def __setitem__(self, key, value):
         if isinstance(key, tuple):
             if any(isinstance(i, slice) for i in key):
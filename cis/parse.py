@@ -6,10 +6,24 @@ import re
 import sys
 import os.path
 import logging
+from collections import namedtuple
 
 from cis.exceptions import InvalidCommandLineOptionError
 from cis.plotting.plot import plot_types, projections
 
+# The options which can be given in each kind of datagroup, created once rather than on every parse
+_PlotDatagroupOptions = namedtuple('DatagroupOptions', ["variables", "filenames", "color", "edgecolor", "itemstyle",
+                                                        "itemwidth",
+                                                        "label", "product", "type", "alpha", "cmap", "vmin",
+                                                        "vmax", "vstep", "contnlevels", "contlevels", "contlabel",
+                                                        "contwidth", "cbarscale", "cbarorient", "colourbar",
+                                                        "cbarlabel"])
+_SamplegroupOptions = namedtuple('SamplegroupOptions',
+                                 ["filenames", "variable", "collocator", "constraint", "kernel", "product"])
+_AggregateDatagroupOptions = namedtuple('DatagroupOptions', ["variables", "filenames", "product", "kernel"])
+_BasicDatagroupOptions = namedtuple('DatagroupOptions', ["variables", "filenames", "product"])
+_FilesDatagroupOptions = namedtuple('DatagroupOptions', ["filenames"])
+
 
 class AliasedSubParsersAction(argparse._SubParsersAction):
     """
@@ -378,18 +392,12 @@ def get_plot_datagroups(datagroups, parser):
     :param parser:       The parser used to report errors
     :return: The parsed datagroups as a list of dictionaries
     """
-    from collections import namedtuple
-
-    DatagroupOptions = namedtuple('DatagroupOptions', ["variables", "filenames", "color", "edgecolor", "itemstyle",
-                                                       "itemwidth",
-                                                       "label", "product", "type", "alpha", "cmap", "vmin",
-                                                       "vmax", "vstep", "contnlevels", "contlevels", "contlabel", "contwidth",
-                                                       "cbarscale", "cbarorient", "colourbar", "cbarlabel"])
-    datagroup_options = DatagroupOptions(check_is_not_empty, expand_file_list, check_color, check_color, check_nothing,
-                                         check_float,
-                                         check_nothing, check_product, check_plot_type, check_float, check_nothing, check_float,
-                                         check_float, check_float, check_int, convert_to_list_of_floats, check_boolean, check_int,
-                                         check_float, check_nothing, check_boolean, check_nothing)
+    datagroup_options = _PlotDatagroupOptions(check_is_not_empty, expand_file_list, check_color, check_color,
+                                              check_nothing, check_float,
+                                              check_nothing, check_product, check_plot_type, check_float, check_nothing,
+                                              check_float, check_float, check_float, check_int, convert_to_list_of_floats,
+                                              check_boolean, check_int, check_float, check_nothing, check_boolean,
+                                              check_nothing)
     return parse_colon_and_comma_separated_arguments(datagroups, parser, datagroup_options, compulsory_args=2)
 
 
@@ -399,12 +407,8 @@ def get_col_samplegroup(samplegroup, parser):
     :param parser:       The parser used to report errors
     :return: The parsed samplegroups as a list of dictionaries
     """
-    from collections import namedtuple
-
-    DatagroupOptions = namedtuple('SamplegroupOptions',
-                                  ["filenames", "variable", "collocator", "constraint", "kernel", "product"])
-    samplegroup_options = DatagroupOptions(expand_file_list, check_nothing, extract_method_and_args,
-                                           extract_method_and_args, extract_method_and_args, check_product)
+    samplegroup_options = _SamplegroupOptions(expand_file_list, check_nothing, extract_method_and_args,
+                                              extract_method_and_args, extract_method_and_args, check_product)
 
     return parse_colon_and_comma_separated_arguments(samplegroup, parser, samplegroup_options, compulsory_args=1)[0]
 
@@ -415,20 +419,14 @@ def get_aggregate_datagroups(datagroups, parser):
     :param parser:       The parser used to report errors
     :return: The parsed datagroups as a list of dictionaries
     """
-    from collections import namedtuple
-
-    DatagroupOptions = namedtuple('DatagroupOptions', ["variables", "filenames", "product", "kernel"])
-    datagroup_options = DatagroupOptions(check_is_not_empty_and_comma_split, expand_file_list, check_product,
-                                         check_aggregate_kernel)
+    datagroup_options = _AggregateDatagroupOptions(check_is_not_empty_and_comma_split, expand_file_list,
+                                                   check_product, check_aggregate_kernel)
 
     return parse_colon_and_comma_separated_arguments(datagroups, parser, datagroup_options, compulsory_args=2)
 
 
 def get_eval_datagroups(datagroups, parser):
-    from collections import namedtuple
-
-    DatagroupOptions = namedtuple('DatagroupOptions', ["variables", "filenames", "product"])
-    datagroup_options = DatagroupOptions(check_is_not_empty_and_comma_split, expand_file_list, check_product)
+    datagroup_options = _BasicDatagroupOptions(check_is_not_empty_and_comma_split, expand_file_list, check_product)
 
     datagroups = parse_colon_and_comma_separated_arguments(datagroups, parser, datagroup_options, compulsory_args=2)
 
@@ -494,10 +492,7 @@ def get_basic_datagroups(datagroups, parser):
     :param parser:       The parser used to report errors
     :return: The parsed datagroups as a list of dictionaries
     """
-    from collections import namedtuple
-
-    DatagroupOptions = namedtuple('DatagroupOptions', ["variables", "filenames", "product"])
-    datagroup_options = DatagroupOptions(check_is_not_empty_and_comma_split, expand_file_list, check_product)
+    datagroup_options = _BasicDatagroupOptions(check_is_not_empty_and_comma_split, expand_file_list, check_product)
 
     return parse_colon_and_comma_separated_arguments(datagroups, parser, datagroup_options, compulsory_args=2)
 
@@ -880,13 +875,11 @@ def validate_plot_args(arguments, parser):
 
 
 def validate_info_args(arguments, parser):
-    from collections import namedtuple
     # See how many colon-split arguments there are (taking into account escaped colons)
     split_input = [re.sub(r'([\\]):', r':', word) for word in re.split(r'(?<!\\):', arguments.datagroups[0])]
     if len(split_input) == 1:
         # If there is only one part of the datagroup then it must be a file (or list of files).
-        DatagroupOptions = namedtuple('DatagroupOptions', ["filenames"])
-        datagroup_options = DatagroupOptions(expand_file_list)
+        datagroup_options = _FilesDatagroupOptions(expand_file_list)
         arguments.datagroups = parse_colon_and_comma_separated_arguments(arguments.datagroups, parser,
                                                                          datagroup_options, compulsory_args=1)
     else:
@@ -1,11 +1,85 @@
 import re
-from cis.time_util import cis_standard_time_unit
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from cis.time_util import cis_standard_time_unit, PartialDateTime
 import argparse
+import numpy as np
+import dateutil.parser as du
+
+# Bound once as it is called for every date/time string parsed. This is tied to the cis_standard_time_unit object
+#  imported here, which is a module level constant of cis.time_util and never rebound.
+_date2num = cis_standard_time_unit.date2num
+
+# Fully specified ISO 8601 date/times (with no time zone), which can be parsed without dateutil. Other forms
+#  (including partial times, which dateutil completes using the current date) are left to dateutil.
+_ISO_DATETIME_RES = (re.compile(r'(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}):(\d{2}))?$'),
+                     re.compile(r'(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2})$'))
+# Separates the date and time of a partial date/time at the first character that is one of 'T', ' ' or ':'
+_PARTIAL_DT_RE = re.compile(r'(?P<date>[^T :]+)(?:[T :])(?P<time>.+)$')
+# Characters separating the date and time parts of an ISO 8601 date/time delta, and the index in to
+#  (years, months, days, hours, minutes, seconds) of each unit letter in the date and time parts
+_DELTA_SEPARATORS = frozenset('T :')
+_DELTA_DATE_UNITS = {'Y': 0, 'M': 1, 'D': 2}
+_DELTA_TIME_UNITS = {'H': 3, 'M': 4, 'S': 5}
+_ORD_ZERO = ord('0')
+# A date/time delta with its units in the canonical order, which can be matched in one go
+_DURATION_RE = re.compile(r'P(?:([0-9]+)Y)?(?:([0-9]+)M)?(?:([0-9]+)D)?(?:T(?:([0-9]+)H)?(?:([0-9]+)M)?(?:([0-9]+)S)?)?')
+# Plain integers and floats given on the command line
+_INT_RE = re.compile(r'[+-]?[0-9]+')
+_FLOAT_RE = re.compile(r'[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?')
+
+
+@lru_cache(maxsize=1 << 17)
+def _cached_dateutil_parse(s, today):
+    """Parse a date/time string using dateutil, caching the result.
+
+    Any date components missing from the string are taken from the current date by dateutil, so today's date is
+    included in the cache key to make sure these are never out of date.
+    :param s: String to parse
+    :param today: The current date
+    :return: datetime
+    """
+    return du.parse(s)
+
+
+@lru_cache(maxsize=1 << 17)
+def _cached_date2num(dt):
+    """Convert a datetime into CIS standard time, caching the result.
+    """
+    return _date2num(dt)
+
+
+def _parse_iso_datetime(s):
+    """Parse a fully specified ISO 8601 date/time string without using dateutil.
+
+    :param s: String to parse
+    :return: datetime, or None if the string isn't in one of the simple ISO 8601 forms
+    """
+    for iso_re in _ISO_DATETIME_RES:
+        match = iso_re.match(s)
+        if match is not None:
+            try:
+                return datetime(*(int(x) for x in match.groups() if x is not None))
+            except ValueError:
+                # Let dateutil report the error
+                return None
+    return None
 
 
 def parse_datetimestr_to_std_time(s):
-    import dateutil.parser as du
-    return cis_standard_time_unit.date2num(du.parse(s))
+    return _cached_date2num(_parse_datetime(s))
+
+
+def parse_datetimestr_to_std_time_array(strings):
+    """Parse an array of date/time strings into CIS standard time, parsing each distinct string only once.
+
+    :param strings: Array (or other sequence) of strings to parse
+    :return: Float array of standard times, the same shape as strings
+    """
+    arr = np.asarray(strings)
+    uniq, inv = np.unique(arr, return_inverse=True)
+    vals = np.fromiter((parse_datetimestr_to_std_time(s) for s in uniq), dtype=np.float64, count=len(uniq))
+    return vals[inv].reshape(arr.shape)
 
 
 def _parse_datetime(s):
@@ -14,8 +88,10 @@ def _parse_datetime(s):
     The string should be in an ISO 8601 format except that the date and time
     parts may be separated by a space or colon instead of T.
     """
-    import dateutil.parser as du
-    return du.parse(s)
+    dt = _parse_iso_datetime(s)
+    if dt is None:
+        dt = _cached_dateutil_parse(s, date.today())
+    return dt
 
 
 def _parse_partial_datetime(dt_string):
@@ -27,27 +103,21 @@ def _parse_partial_datetime(dt_string):
     :return: list of datetime components
     :raise ValueError: if the string cannot be parsed as a date/time
     """
-    from cis.time_util import PartialDateTime
-
-    # Separate date and time at first character that is one of 'T', ' ' or ':'.
-    match = re.match(r'(?P<date>[^T :]+)(?:[T :])(?P<time>.+)$', dt_string)
+    match = _PARTIAL_DT_RE.match(dt_string)
     if match is not None:
         date_str = match.group('date')
-        time_components = [int(x) for x in match.group('time').split(':')]
+        time_components = tuple(map(int, match.group('time').split(':')))
     else:
         date_str = dt_string
-        time_components = []
+        time_components = ()
 
-    date_components = [int(x) for x in date_str.split('-')]
+    date_components = tuple(map(int, date_str.split('-')))
 
-    dt_components = list(date_components)
     if ((len(date_components) > 3) or (len(time_components) > 3) or
             (len(date_components) < 3) and (len(time_components) > 0)):
         raise ValueError()
-    else:
-        dt_components.extend(time_components)
 
-    return PartialDateTime(*dt_components)
+    return PartialDateTime._from_tuple(date_components + time_components)
 
 
 def parse_partial_datetime(dt_string, name, parser):
@@ -90,76 +160,69 @@ def parse_datetime(dt_string, name, parser):
     return dt
 
 
-def _parse_datetime_delta(dt_string):
+def _parse_datetime_delta_fields(dt_string):
     """Parse a date/time delta string into years, months, days, hours, minutes and seconds.
 
     :param dt_string: String to parse, for example 'PY2M3DT4H5M6S' (ISO 8601)
-    :return: Named tuple 'date_delta' containing, 'year', 'month', 'day', 'hour', 'minute', 'second'
+    :return: list of the years, months, days, hours, minutes and seconds
     :raise ValueError: if the string cannot be parsed as a date/time delta
     """
-    from datetime import timedelta
     dt_string = dt_string.upper()
 
-    match = re.match(r'(?:[P])(?P<date>[^T :]+)?(?:[T :])?(?P<time>.+)?$', dt_string)
+    match = _DURATION_RE.fullmatch(dt_string)
+    if match is not None:
+        return list(map(int, match.groups('0')))
 
-    if match is None:
+    if not dt_string.startswith('P'):
         raise ValueError('Date/Time step must be in ISO 8601 format, for example PY2M3DT4H5M6S.')
 
-    if match.group('date') is not None:
-        date_string = match.group('date')
-    else:
-        date_string = ''
-
-    if match.group('time') is not None:
-        time_string = match.group('time')
-    else:
-        time_string = ''
-
-    date_tokens = re.findall('[0-9]*[A-Z]', date_string)
-    time_tokens = re.findall('[0-9]*[A-Z]', time_string)
-
-    years = 0
-    months = 0
-    days = 0
-    hours = 0
-    minutes = 0
-    seconds = 0
-
-    for token in date_tokens:
-        val = int(token[:-1])
-        if token[-1:] == "Y":
-            years = val
-        elif token[-1:] == "M":
-            months = val
-        elif token[-1:] == "D":
-            days = val
-        else:
-            raise ValueError("Date/Time step must be in ISO 8601 format, for example PY2M3DT4H5M6S")
-
-    for token in time_tokens:
-        val = int(token[:-1])
-        if token[-1:] == "H":
-            hours = val
-        elif token[-1:] == "M":
-            minutes = val
-        elif token[-1:] == "S":
-            seconds = val
+    # Single pass over the string: accumulate the digits of each value and store it in the field given by the
+    #  letter which follows. Other characters are skipped, and discard any digits accumulated before them.
+    #  The module level lookups are bound to locals as this loop runs per character.
+    _ord, ord_zero, separators = ord, _ORD_ZERO, _DELTA_SEPARATORS
+    unit_index = _DELTA_DATE_UNITS.get
+    fields = [0, 0, 0, 0, 0, 0]
+    in_time = False
+    val = None
+    for c in dt_string[1:]:
+        if '0' <= c <= '9':
+            val = (0 if val is None else val * 10) + (_ord(c) - ord_zero)
+        elif not in_time and c in separators:
+            in_time = True
+            unit_index = _DELTA_TIME_UNITS.get
+            val = None
+        elif 'A' <= c <= 'Z':
+            idx = unit_index(c)
+            if idx is None or val is None:
+                raise ValueError("Date/Time step must be in ISO 8601 format, for example PY2M3DT4H5M6S")
+            fields[idx] = val
+            val = None
         else:
-            raise ValueError("Date/Time step must be in ISO 8601 format, for example PY2M3DT4H5M6S")
+            val = None
+    return fields
+
+
+def _parse_datetime_delta(dt_string):
+    """Parse a date/time delta string into a timedelta.
+
+    :param dt_string: String to parse, for example 'PY2M3DT4H5M6S' (ISO 8601)
+    :return: timedelta
+    :raise ValueError: if the string cannot be parsed as a date/time delta
+    """
+    years, months, days, hours, minutes, seconds = _parse_datetime_delta_fields(dt_string)
 
     # Note that there is a loss of precision here because we have to convert months and years to integer days
     dt = timedelta(seconds=seconds, minutes=minutes, hours=hours, days=(days + months*30 + years*365))
     return dt
 
 
-def _datetime_delta_to_float_days(td):
+def _datetime_delta_to_float_days(years, months, days, hours, minutes, seconds):
     """
-    Converts a timedelta into a fractional day
-    :param td: the timedelta to be converted
+    Converts the fields of a date/time delta into a fractional day, treating months as 30 days and years as 365
+    days (as in _parse_datetime_delta)
     :return: a float representation of a day
     """
-    sec = 1.0/(24.0*60.0*60.0)  # Conversion from sec to day
-    return td.total_seconds()*sec
+    return (days + months*30 + years*365) + (hours*3600 + minutes*60 + seconds)/86400.0
 
 
 def parse_datetimestr_delta_to_float_days(string):
@@ -169,8 +232,7 @@ def parse_datetimestr_delta_to_float_days(string):
     :return: a float representation of a day
     """
 
-    date_delta = _parse_datetime_delta(string)
-    return _datetime_delta_to_float_days(date_delta)
+    return _datetime_delta_to_float_days(*_parse_datetime_delta_fields(string))
 
 
 def parse_as_number_or_datetime(string):
@@ -182,17 +244,29 @@ def parse_as_number_or_datetime(string):
     """
     if string == 'None' or string is None:
         return None
+    # Plain numbers can be dispatched on the form of the string, without trying each conversion in turn
+    if _INT_RE.fullmatch(string):
+        return int(string)
+    if _FLOAT_RE.fullmatch(string):
+        return float(string)
+
+    # int() and float() also accept some less usual forms, such as surrounding whitespace, underscores, nan and inf
     try:
-        ret = int(string)
+        return int(string)
     except ValueError:
-        try:
-            ret = float(string)
-        except ValueError:
-            try:
-                ret = _parse_datetime(string)
-            except ValueError:
-                raise argparse.ArgumentTypeError("'{}' is not a valid value.".format(string))
-    return ret
+        pass
+    try:
+        return float(string)
+    except ValueError:
+        pass
+
+    # A string without any digits can't name a specific date/time, so don't pass it through dateutil
+    if not any(c.isdigit() for c in string):
+        raise argparse.ArgumentTypeError("'{}' is not a valid value.".format(string))
+    try:
+        return _parse_datetime(string)
+    except ValueError:
+        raise argparse.ArgumentTypeError("'{}' is not a valid value.".format(string))
 
 
 def parse_as_number_or_standard_time(string):
@@ -202,10 +276,9 @@ def parse_as_number_or_standard_time(string):
     :param in_string: String to parse
     :return: int, float (possibly representing a time in CIS standard time units)
     """
-    from datetime import datetime
     res = parse_as_number_or_datetime(string)
     if isinstance(res, datetime):
-        res = cis_standard_time_unit.date2num(res)
+        res = _date2num(res)
     return res
 
 
@@ -24,8 +24,10 @@ class ContourPlot(Generic2DPlot):
         if contlevels:
             self.levels = contlevels
         elif self.vstep:
-            self.levels = (kwargs.get('vmax', self.data.max()) -
-                           kwargs.get('vmin', self.data.min())) / vstep
+            # Only reduce over the (possibly large) data for the limits which haven't been given
+            vmax = kwargs['vmax'] if 'vmax' in kwargs else self.data.max()
+            vmin = kwargs['vmin'] if 'vmin' in kwargs else self.data.min()
+            self.levels = (vmax - vmin) / vstep
         else:
             self.levels = contnlevels
 
@@ -36,8 +38,9 @@ class ContourPlot(Generic2DPlot):
     def __call__(self, ax):
         from matplotlib import ticker
 
-        # Set the options specific to a datagroup with the contour type
-        mplkwargs = self.mplkwargs
+        # Set the options specific to a datagroup with the contour type, on a copy so that (re)drawing the plot
+        #  doesn't modify its keyword arguments
+        mplkwargs = dict(self.mplkwargs)
 
         mplkwargs["colors"] = self.color
 
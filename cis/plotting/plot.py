@@ -4,6 +4,7 @@ Also contains a dictionary for the valid plot types.
 All plot types need to be imported and added to the plot_types dictionary in order to be used.
 """
 import logging
+from functools import lru_cache
 
 from cis.plotting.comparativescatter import ComparativeScatter
 from cis.plotting.contourplot import ContourPlot, ContourfPlot
@@ -42,13 +43,21 @@ def format_units(units):
     :param units: The units of a variable, as a string
     :return: The units surrounding brackets, or the empty string if no units given
     """
-    if "since" in str(units):
-        # Assume we are on a time if the units contain since.
+    if not units:
         return ""
-    elif units:
-        return "(" + str(units) + ")"
-    else:
+    return _format_units_str(str(units))
+
+
+@lru_cache(maxsize=256)
+def _format_units_str(units_str):
+    """
+    Format the string form of some (non-empty) units, caching the result as the same units are labelled on every
+    axis and every redraw
+    """
+    if "since" in units_str:
+        # Assume we are on a time if the units contain since.
         return ""
+    return "(" + units_str + ")"
 
 
 def get_label(common_data, units=True):
@@ -73,17 +82,12 @@ def _try_coord(data, coord_dict):
     :param dict coord_dict: Kwargs to look for coord
     :return: A single Coord or None if none can be found
     """
-    import cis.exceptions as cis_ex
-    import iris.exceptions as iris_ex
-    try:
-        coord = data.coord(**coord_dict)
-    except (iris_ex.CoordinateNotFoundError, cis_ex.CoordinateNotFoundError):
-        coord = None
-    else:
-        if not len(coord.points) > 1:
-            # Don't guess a scalar coord
-            coord = None
-    return coord
+    # Look the coord up with coords() rather than catching the error coord() raises, as most lookups miss
+    coords = data.coords(**coord_dict)
+    if len(coords) == 1 and len(coords[0].points) > 1:
+        # Don't guess a scalar coord
+        return coords[0]
+    return None
 
 
 def get_axis(d, axis, name=None):
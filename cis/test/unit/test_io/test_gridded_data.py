@@ -254,6 +254,92 @@ def test_set_longitude_bounds_wrap_at_180():
     assert ((long_coord.bounds[6] == np.array([22.5, 67.5])).all())
 
 
+@istest
+def test_set_longitude_range_leaves_data_in_range_unchanged():
+    gd = gridded_data.make_from_cube(mock.make_mock_cube(lat_dim_length=5, lon_dim_length=9))
+    long_coord = gd.coord('longitude')
+    long_coord.points = np.array([0., 45., 90., 135., 180., 225., 270., 315., 359.])
+    data = gd.data
+    gd.set_longitude_range(0.0)
+    assert (gd.data is data)
+    assert (gd.coord('longitude').points[0] == 0.0)
+    assert (gd.coord('longitude').points[8] == 359.0)
+
+
+@istest
+def test_find_standard_coords_is_updated_when_coords_change():
+    gd = gridded_data.make_from_cube(mock.make_mock_cube())
+    std_coords = gd.find_standard_coords()
+    assert (std_coords[0][0].name() == 'latitude')
+    assert (std_coords[1][0].name() == 'longitude')
+    assert (gd.find_standard_coords() is std_coords)
+    gd.transpose()
+    assert (gd.find_standard_coords()[0][1] == 1)
+    assert (gd.find_standard_coords()[1][1] == 0)
+    gd.remove_coord('latitude')
+    assert (gd.find_standard_coords()[0] is None)
+
+
+@istest
+def test_find_standard_coords_is_updated_when_coord_is_renamed_in_place():
+    gd = gridded_data.make_from_cube(mock.make_mock_cube())
+    assert (gd.find_standard_coords()[1][0].name() == 'longitude')
+    gd.coord('longitude').standard_name = 'grid_longitude'
+    assert (gd.find_standard_coords()[1] is None)
+
+
+@istest
+def test_find_standard_coords_is_updated_when_non_standard_coord_is_replaced():
+    from iris.coords import DimCoord
+    for _ in range(50):
+        gd = gridded_data.make_from_cube(mock.make_mock_cube())
+        gd.remove_coord('longitude')
+        gd.add_dim_coord(DimCoord(np.arange(3.), long_name='other'), 1)
+        assert (gd.find_standard_coords()[1] is None)
+        gd.remove_coord('other')
+        gd.add_dim_coord(DimCoord(np.arange(3.), standard_name='longitude'), 1)
+        assert (gd.find_standard_coords()[1][0].name() == 'longitude')
+
+
+@istest
+def test_set_longitude_range_keeps_lazy_data_lazy():
+    import dask.array as da
+    gd = gridded_data.make_from_cube(mock.make_mock_cube(lat_dim_length=5, lon_dim_length=9))
+    expected = gridded_data.make_from_cube(gd.copy())
+    expected.coord('longitude').points = np.array([0., 45., 90., 135., 181., 225., 270., 315., 359.])
+    gd.coord('longitude').points = np.array([0., 45., 90., 135., 181., 225., 270., 315., 359.])
+    gd.data = da.from_array(gd.data, chunks=(5, 3))
+    gd.set_longitude_range(-180.0)
+    expected.set_longitude_range(-180.0)
+    assert gd.has_lazy_data()
+    assert (gd.coord('longitude').points == expected.coord('longitude').points).all()
+    assert (gd.data == expected.data).all()
+
+
+@istest
+def test_make_new_with_same_coordinates_defaults_to_lazy_zeros():
+    gd = gridded_data.make_from_cube(mock.make_mock_cube())
+    new_gd = gd.make_new_with_same_coordinates(var_name='new', history='Created')
+    assert new_gd.has_lazy_data()
+    assert (new_gd.shape == gd.shape)
+    assert (new_gd.dtype == gd.dtype)
+    assert (new_gd.data == 0).all()
+    assert (new_gd.coord('longitude') == gd.coord('longitude'))
+
+
+@istest
+def test_as_data_frame_of_large_lazy_data_matches_realised_data():
+    import dask.array as da
+    from mock import patch
+    gd = gridded_data.make_from_cube(mock.make_mock_cube())
+    expected = gd.as_data_frame()
+    gd.data = da.from_array(gd.data, chunks=(2, 3))
+    with patch('cis.data_io.gridded_data._LAZY_DATA_FRAME_THRESHOLD', 0):
+        df = gd.as_data_frame()
+    assert gd.has_lazy_data()
+    assert df.equals(expected)
+
+
 if __name__ == '__main__':
     import nose
 
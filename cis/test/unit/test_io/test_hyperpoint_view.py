@@ -213,6 +213,15 @@ class TestGriddedHyperPointView(object):
         assert(indices == [0, 1, 2, 3, 5, 6, 7, 9, 10, 11, 13, 14])
         assert(vals == [1, 2, 3, 4, 6, 7, 8, 10, 11, 12, 14, 15])
 
+    @istest
+    def test_can_iterate_over_points_with_a_length_one_dimension(self):
+        gd = gridded_data.make_from_cube(mock.make_mock_cube(lat_dim_length=3, lon_dim_length=4, time_dim_length=1))
+        for hpv in [gd.get_all_points(), gd.get_non_masked_points(), gd.get_coordinates_points()]:
+            points = list(hpv)
+            assert(len(points) == 12)
+            assert(points[5].latitude == 0.0)
+            assert(points[5].longitude == -1.6666666666666665)
+
     @istest
     def test_can_set_a_hyperpoint_via_flat_index(self):
         gd = gridded_data.make_from_cube(mock.make_5x3_lon_lat_2d_cube_with_missing_data())
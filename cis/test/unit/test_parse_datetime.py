@@ -1,6 +1,7 @@
 """Tests for parse_datetime module
 """
 from nose.tools import istest, raises, assert_almost_equal, eq_
+from argparse import ArgumentTypeError
 from cis.parse_datetime import _parse_partial_datetime, parse_as_number_or_datetime, \
                                parse_datetimestr_delta_to_float_days, parse_datetimestr_to_std_time
 from cis.time_util import PartialDateTime
@@ -120,17 +121,74 @@ def parse_as_number_or_datetime_can_parse_float():
     assert (dt == 12.345)
 
 
+@istest
+def parse_as_number_or_datetime_can_parse_less_usual_numbers():
+    eq_(parse_as_number_or_datetime('-1e-3'), -1e-3)
+    eq_(parse_as_number_or_datetime(' 12 '), 12)
+    eq_(parse_as_number_or_datetime('1_000'), 1000)
+    eq_(parse_as_number_or_datetime('-inf'), float('-inf'))
+
+
+@istest
+@raises(ArgumentTypeError)
+def parse_as_number_or_datetime_raises_an_error_for_a_string_without_digits():
+    parse_as_number_or_datetime('notadate')
+
+
+@istest
+def parse_as_number_or_datetime_can_parse_date_without_dashes_or_colons():
+    from datetime import datetime
+    dt = parse_as_number_or_datetime('2010/07/01')
+    assert (dt == datetime(2010, 7, 1))
+
+
 @istest
 def test_that_can_parse_time_deltas():
     delta = parse_datetimestr_delta_to_float_days("P2y15m3dT5M10H3S")
     assert_almost_equal(1183.420173611111, delta)
 
 
+@istest
+def test_that_float_days_of_deltas_match_their_timedeltas():
+    from datetime import timedelta
+    from itertools import product
+    from cis.parse_datetime import _datetime_delta_to_float_days
+    for fields in product([0, 1, 13], [0, 2, 29], [0, 7, 400], [0, 5, 25], [0, 59, 61], [0, 1, 86401]):
+        years, months, days, hours, minutes, seconds = fields
+        td = timedelta(seconds=seconds, minutes=minutes, hours=hours, days=(days + months*30 + years*365))
+        assert_almost_equal(td.total_seconds() / 86400.0, _datetime_delta_to_float_days(*fields))
+
+
 @istest
 @raises(ValueError)
 def test_that_raise_an_error_when_datetimestr_delta_is_invalid():
     parse_datetimestr_delta_to_float_days("some wierd string")
 
+
+@istest
+def test_that_can_parse_time_deltas_in_canonical_order():
+    delta = parse_datetimestr_delta_to_float_days("P1Y2M3DT4H5M6S")
+    assert_almost_equal(428 + (4 * 3600 + 5 * 60 + 6) / 86400.0, delta)
+
+
+@istest
+def test_that_can_parse_date_only_and_time_only_deltas():
+    assert_almost_equal(3.0, parse_datetimestr_delta_to_float_days("P3D"))
+    assert_almost_equal(0.25, parse_datetimestr_delta_to_float_days("PT6H"))
+
+
+@istest
+@raises(ValueError)
+def test_that_raise_an_error_when_datetimestr_delta_unit_has_no_value():
+    parse_datetimestr_delta_to_float_days("P2YMT4H")
+
+
+@istest
+@raises(ValueError)
+def test_that_raise_an_error_when_datetimestr_delta_has_time_unit_in_date_part():
+    parse_datetimestr_delta_to_float_days("P4H")
+
+
 @istest
 def test_that_can_parse_datetimestr_to_obj():
     from cis.time_util import convert_datetime_to_std_time
@@ -155,6 +213,38 @@ def test_that_can_parse_datetimestr_to_obj():
         convert_datetime_to_std_time(dt.datetime(2010, now.month, now.day)))
 
 
+@istest
+def test_that_repeated_datetimestr_is_only_parsed_once():
+    from cis.parse_datetime import _cached_dateutil_parse
+    _cached_dateutil_parse.cache_clear()
+    first = parse_datetimestr_to_std_time("2011-03-04 05:06")
+    second = parse_datetimestr_to_std_time("2011-03-04 05:06")
+    eq_(first, second)
+    eq_(_cached_dateutil_parse.cache_info().misses, 1)
+    eq_(_cached_dateutil_parse.cache_info().hits, 1)
+
+
+@istest
+def test_that_iso_datetime_fast_path_matches_dateutil():
+    import dateutil.parser as du
+    from cis.parse_datetime import _parse_iso_datetime
+    for dt_string in ["2010-02-05", "2010-02-05T02:15:45", "2010-02-05 02:15:45", "20100205T021545"]:
+        eq_(_parse_iso_datetime(dt_string), du.parse(dt_string))
+    for dt_string in ["2010-02-30", "2010-02-05 02", "2010-2-5", "2010-02-05T02:15:45Z"]:
+        eq_(_parse_iso_datetime(dt_string), None)
+
+
+@istest
+def test_that_can_parse_array_of_datetimestrs_to_std_time():
+    from cis.parse_datetime import parse_datetimestr_to_std_time_array
+    strings = [["2010-02-05 02:15:45", "2011-03-04"], ["2010-02-05 02:15:45", "2010-02-05"]]
+    result = parse_datetimestr_to_std_time_array(strings)
+    eq_(result.shape, (2, 2))
+    for res_row, str_row in zip(result, strings):
+        for res, s in zip(res_row, str_row):
+            eq_(res, parse_datetimestr_to_std_time(s))
+
+
 if __name__ == '__main__':
     import nose
 
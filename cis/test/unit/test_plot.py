@@ -29,6 +29,11 @@ class TestPlotting(unittest.TestCase):
         assert format_units("seconds since 1600") == ""  # We don't want any units as they will be converted to DateTime
         assert format_units(Unit("kg s-1")) == "(kg s-1)"
 
+    def test_units_formatting_of_missing_units(self):
+        from cis.plotting.plot import format_units
+        assert format_units(None) == ""
+        assert format_units("") == ""
+
     def test_get_label(self):
         from cis.plotting.plot import get_label
         from cis.test.util.mock import make_dummy_1d_ungridded_data
@@ -58,6 +63,8 @@ class TestPlotting(unittest.TestCase):
         d = make_from_cube(make_mock_cube())
         assert get_axis(d, "x").name() == 'longitude'
         assert get_axis(d, "y").name() == 'latitude'
+        assert get_axis(d, "x", 'latitude').name() == 'latitude'
+        assert get_axis(d, "x", 'bad_name').name() == 'longitude'  # Falls back on axis name
 
 
 class TestHeatMap(unittest.TestCase):
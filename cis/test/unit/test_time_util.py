@@ -137,6 +137,14 @@ class TestTimeUtils(TestCase):
     def test_convert_datetime_components_to_datetime_raises_error_if_invalid_time(self):
         start, end = PartialDateTime(2000, 6, 30, 12, 30, 60).range()
 
+    def test_partial_datetime_from_tuple_equals_partial_datetime(self):
+        eq_(PartialDateTime._from_tuple((1990, 6)), PartialDateTime(1990, 6))
+        eq_(PartialDateTime._from_tuple((1990, 6, 7, 12, 15, 45)), PartialDateTime(1990, 6, 7, 12, 15, 45))
+
+    @raises(ValueError)
+    def test_partial_datetime_from_tuple_raises_error_if_invalid_date(self):
+        PartialDateTime._from_tuple((2000, 6, 31))
+
     def test_set_year(self):
         from datetime import datetime
 
@@ -292,6 +292,17 @@ class TestUtils(unittest.TestCase):
         conc = concatenate(arrays)
         assert numpy.ma.count_masked(conc) == 1
 
+    def test_find_bucket_indices_matches_searchsorted(self):
+        regular = numpy.arange(-180., 180., 2.5)
+        irregular = numpy.array([0., 45., 90., 135., 181., 225., 270., 315., 359.])
+        queries = numpy.array([-400., -180., -179., 0., 2.5, 90., 179.9, 180., 181., 360., 500., numpy.nan,
+                               -numpy.inf, numpy.inf])
+        for points in [regular, irregular]:
+            for side in ['left', 'right']:
+                expected = numpy.searchsorted(points, queries, side=side) - 1
+                assert (find_bucket_indices(points, queries, side=side) == expected).all()
+                assert (find_bucket_indices(points, queries[3], side=side) == expected[3])
+
 
 class TestFindLongitudeWrapStart(unittest.TestCase):
 
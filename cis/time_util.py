@@ -13,6 +13,8 @@ class PartialDateTime(object):
     primarily for creating ranges of :class:`datetime.datetime` instances.
     """
 
+    attributes = ['year', 'month', 'day', 'hour', 'minute', 'second']
+
     def __init__(self, year, month=None, day=None, hour=None, minute=None, second=None):
         """
         Allows creation of datetime ranges. The year is mandatory, all others are optional - but intermediate components
@@ -32,13 +34,29 @@ class PartialDateTime(object):
         self.minute = minute
         self.second = second
 
-        self.attributes = ['year', 'month', 'day', 'hour', 'minute', 'second']
-
         # Check we have valid components - there should be no non-None values after the first one (if there is one)
         components = [getattr(self, a) for a in self.attributes]
         if None in components and any(c is not None for c in components[components.index(None):]):
             raise ValueError("All intermediate values must be specified when creating a PartialDateTime")
 
+        self._check_valid()
+
+    @classmethod
+    def _from_tuple(cls, components):
+        """
+        Create a PartialDateTime from a tuple of its leading components, e.g. (year, month). As there can't be any
+        missing intermediate values this only checks that the components are valid.
+
+        :param tuple components: Between one and six ints, starting with the year
+        :return PartialDateTime:
+        """
+        obj = cls.__new__(cls)
+        obj.year, obj.month, obj.day, obj.hour, obj.minute, obj.second = \
+            tuple(components) + (None,) * (len(cls.attributes) - len(components))
+        obj._check_valid()
+        return obj
+
+    def _check_valid(self):
         # Check that the components are valid by trying to find the minimum date
         try:
             _ = self.min()
@@ -193,6 +193,46 @@ def array_equal_including_nan(array1, array2):
     return True
 
 
+def find_bucket_indices(points, queries, side='right'):
+    """
+    Find the index of the bucket (i.e. the last point before) each of the queries falls into in a monotonically
+    increasing array of points. This is the same as np.searchsorted(points, queries, side=side) - 1, so with
+    side='right' a query equal to a point falls into that point's bucket and with side='left' into the one before.
+    Queries before the first point give -1.
+
+    When the points are evenly spaced the indices are calculated directly from the spacing rather than by a binary
+    search, and then corrected for any rounding so that the result is always identical to np.searchsorted.
+
+    :param ndarray points: 1D array of monotonically increasing points
+    :param queries: Scalar or array of values to find the buckets of
+    :param str side: 'right' or 'left', as for np.searchsorted
+    :return: The bucket index of each query, with the same shape as queries
+    """
+    points = np.asarray(points)
+    queries = np.asarray(queries)
+    n = len(points)
+    step = points[1] - points[0] if n > 1 else 0
+    if not (step > 0 and np.isclose(np.diff(points), step).all()):
+        return np.searchsorted(points, queries, side=side) - 1
+
+    # NaNs are sorted to the end by searchsorted so put them in the last bucket
+    queries = np.where(np.isnan(queries), np.inf, queries)
+    scaled = (queries - points[0]) / step
+    raw = np.floor(scaled) if side == 'right' else np.ceil(scaled) - 1
+    idx = np.clip(raw, -1, n - 1).astype(np.intp)
+
+    def in_bucket(p):
+        return p <= queries if side == 'right' else p < queries
+
+    while True:
+        up = (idx < n - 1) & in_bucket(points[np.minimum(idx + 1, n - 1)])
+        down = (idx >= 0) & ~in_bucket(points[np.maximum(idx, 0)])
+        if not (up.any() or down.any()):
+            break
+        idx = idx + up - down
+    return idx[()]
+
+
 def get_coord(data_object, variable, data):
     """
     Find a specified coord